@@ -16,7 +16,10 @@ from warnings import warn
 import h5py
 import numpy as np
 import dask.array as da
-from collections import Iterable
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 from itertools import groupby
 
 __all__ = ['flatten_complex_to_real', 'get_compound_sub_dtypes', 'flatten_compound_to_real', 'check_dtype',
@@ -62,7 +65,7 @@ def contains_integers(iter_int, min_val=None):
 
     Parameters
     ----------
-    iter_int : :class:`collections.Iterable`
+    iter_int : :class:`collections.abc.Iterable`
         Iterable (e.g. list, tuple, etc.) of integers
     min_val : int, optional, default = None
         The value above which each element of iterable must possess. By default, this is ignored.
@@ -555,7 +558,7 @@ def integers_to_slices(int_array):
 
     Parameters
     ----------
-    int_array : :class:`collections.Iterable`
+    int_array : :class:`collections.abc.Iterable`
         iterable object like a :class:`list` or :class:`numpy.ndarray`
 
     Returns
@@ -574,7 +577,7 @@ def integers_to_slices(int_array):
 
         Parameters
         ----------
-        integer_array : :class:`collections.Iterable`
+        integer_array : :class:`collections.abc.Iterable`
             iterable object like a :class:`list`
 
         Returns
@@ -7,9 +7,12 @@ Created on Tue Nov  3 21:14:25 2015
 @author: Suhas Somnath, Chris Smith
 """
 from __future__ import division, print_function, absolute_import, unicode_literals
-import collections
 from warnings import warn
 import sys
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 import h5py
 import numpy as np
 import dask.array as da
@@ -877,7 +880,7 @@ def check_for_matching_attrs(h5_obj, new_parms=None, verbose=False):
             break
 
         if isinstance(old_value, np.ndarray):
-            if not isinstance(new_parms[key], collections.Iterable):
+            if not isinstance(new_parms[key], Iterable):
                 if verbose:
                     print('New parm: {} \t- new parm not iterable unlike old parm *****'.format(key))
                 tests.append(False)
@@ -901,7 +904,7 @@ def check_for_matching_attrs(h5_obj, new_parms=None, verbose=False):
                     print('New parm: {} \t- match: {}'.format(key, answer))
                 tests.append(answer)
         else:
-            """if isinstance(new_parms[key], collections.Iterable):
+            """if isinstance(new_parms[key], Iterable):
                 if verbose:
                     print('New parm: {} \t- new parm is iterable unlike old parm *****'.format(key))
                 tests.append(False)
@@ -956,7 +959,7 @@ def write_ind_val_dsets(h5_parent_group, dimensions, is_spectral=True, verbose=F
         dimensions = [dimensions]
     if not isinstance(dimensions, (list, np.ndarray, tuple)):
         raise TypeError('dimensions should be array-like ')
-    if not np.all([isinstance(x, Dimension) for x in dimensions]):
+    if not all(isinstance(x, Dimension) for x in dimensions):
         raise TypeError('dimensions should be a sequence of Dimension objects')
 
     if not isinstance(h5_parent_group, (h5py.Group, h5py.File)):
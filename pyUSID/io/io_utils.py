@@ -10,25 +10,64 @@ Created on Tue Nov  3 21:14:25 2015
 from __future__ import division, print_function, absolute_import, unicode_literals
 import os
 import sys
+from bisect import bisect_right
 from numbers import Number
-from collections import Iterable
-from time import strftime
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
+from threading import local
+from time import strftime, localtime, time
 from warnings import warn
-import numpy as np
 
 from .dtype_utils import validate_list_of_strings, validate_string_args
 
 if sys.version_info.major == 3:
     unicode = str
+else:
+    # input() in Python 2 evaluates whatever the user types
+    input = raw_input
+
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2 does not have lru_cache. Simply call the function every time
+    def lru_cache(maxsize=128, typed=False):
+        def decorator(func):
+            return func
+        return decorator
 
 __all__ = ['get_time_stamp', 'file_dialog', 'format_quantity', 'format_time', 'format_size',
-           'get_available_memory', 'get_available_memory']
+           'formatted_str_to_number', 'get_available_memory', 'recommend_cpu_cores']
 
+# Time stamps only change once a second. Cache the last formatted string (per thread) to avoid calling strftime
+# repeatedly within the same second. Set the environment variable PYUSID_TS_CACHE=0 to disable this cache
+_ts_cache = local()
+_TS_CACHE_ENABLED = os.environ.get('PYUSID_TS_CACHE', '1') != '0'
 
+# Scales used by format_time() and format_size(). These never change so compute them only once
+_TIME_UNITS = ('msec', 'sec', 'mins', 'hours')
+_TIME_FACTORS = (0.001, 1, 60, 3600)
+_SIZE_UNITS = ('bytes', 'kB', 'MB', 'GB', 'TB')
+_SIZE_FACTORS = tuple(1024 ** index for index in range(len(_SIZE_UNITS)))
+
+# Only plain python numbers are cached by format_time() and format_size(). Checking the exact type is much cheaper
+# than checking whether an arbitrary value is hashable
+_CACHEABLE_TYPES = (int, float)
+
+# Qt application shared by all file dialogs. Created on the first GUI file dialog and reused thereafter
+_qt_app = None
+
+
+@lru_cache(maxsize=1)
 def check_ssh():
     """
     Checks whether or not the python kernel is running locally (False) or remotely (True)
 
+    Note
+    ----
+    The result is computed once and reused for the lifetime of the python process
+
     Returns
     -------
     output : bool
@@ -37,6 +76,51 @@ def check_ssh():
     return 'SSH_CLIENT' in os.environ or 'SSH_TTY' in os.environ
 
 
+@lru_cache(maxsize=1)
+def _get_gui_file_opener():
+    """
+    Finds the GUI toolkit (PyQt5 or PyQt4) that can be used for presenting file dialogs.
+    The toolkit is only looked up once and reused for subsequent file dialogs.
+    Likewise, a single Qt application is created and kept alive for all file dialogs
+
+    Returns
+    -------
+    open_file : callable or None
+        Function that takes the caption and file filter and returns the path of the selected file.
+        None if neither PyQt5 nor PyQt4 is available
+    """
+    try:
+        from PyQt5 import QtWidgets
+    except ImportError:
+        warn('The required package PyQt5 could not be imported.\n'
+             'The code will check for PyQt4.')
+
+    else:
+        def open_file(caption, file_filter):
+            global _qt_app
+            if _qt_app is None:
+                _qt_app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+            return QtWidgets.QFileDialog.getOpenFileName(caption=caption, filter=file_filter)[0]
+
+        return open_file
+
+    try:
+        from PyQt4 import QtGui
+    except ImportError:
+        warn('PyQt4 also not found.  Will use standard text input.')
+        return None
+
+    def open_file(caption, file_filter):
+        global _qt_app
+        if _qt_app is None:
+            _qt_app = QtGui.QApplication.instance() or QtGui.QApplication([])
+
+        return QtGui.QFileDialog.getOpenFileName(caption=caption, filter=file_filter)
+
+    return open_file
+
+
 def file_dialog(file_filter='H5 file (*.h5)', caption='Select File'):
     """
     Presents a File dialog used for selecting the .mat file
@@ -61,33 +145,9 @@ def file_dialog(file_filter='H5 file (*.h5)', caption='Select File'):
 
     # Only try to use the GUI options if not over an SSH connection.
     if not check_ssh():
-        try:
-            from PyQt5 import QtWidgets
-        except ImportError:
-            warn('The required package PyQt5 could not be imported.\n',
-                 'The code will check for PyQt4.')
-
-        else:
-            app = QtWidgets.QApplication([])
-            path = QtWidgets.QFileDialog.getOpenFileName(caption=caption, filter=file_filter)[0]
-            app.closeAllWindows()
-            app.exit()
-            del app
-
-            return str(path)
-
-        try:
-            from PyQt4 import QtGui
-        except ImportError:
-            warn('PyQt4 also not found.  Will use standard text input.')
-
-        else:
-            app = QtGui.QApplication([])
-            path = QtGui.QFileDialog.getOpenFileName(caption=caption, filter=file_filter)
-            app.exit()
-            del app
-
-            return str(path)
+        open_file = _get_gui_file_opener()
+        if open_file is not None:
+            return str(open_file(caption, file_filter))
 
     path = input('Enter path to datafile.  Raw Data (*.txt, *.mat, *.xls, *.xlsx) or Translated file (*.h5)')
 
@@ -105,8 +165,20 @@ def get_time_stamp():
     Returns
     -------
     String
+
+    Note
+    ----
+    The formatted string is cached (per thread) and only recomputed when the second changes.
+    Set the environment variable PYUSID_TS_CACHE=0 to disable this cache. The variable is only read when
+    pyUSID.io.io_utils is first imported, so it must be set before importing pyUSID
     """
-    return strftime('%Y_%m_%d-%H_%M_%S')
+    if not _TS_CACHE_ENABLED:
+        return strftime('%Y_%m_%d-%H_%M_%S')
+    now = int(time())
+    if getattr(_ts_cache, 'sec', None) != now:
+        _ts_cache.str = strftime('%Y_%m_%d-%H_%M_%S', localtime(now))
+        _ts_cache.sec = now
+    return _ts_cache.str
 
 
 def format_quantity(value, unit_names, factors, decimals=2):
@@ -130,15 +202,17 @@ def format_quantity(value, unit_names, factors, decimals=2):
         String with value formatted correctly
     """
     # assert isinstance(value, (int, float))
-    if not isinstance(unit_names, Iterable):
+    # Checking against list and tuple first avoids the slower Iterable ABC check in the common case
+    if not isinstance(unit_names, (list, tuple)) and not isinstance(unit_names, Iterable):
         raise TypeError('unit_names must an Iterable')
-    if not isinstance(factors, Iterable):
+    if not isinstance(factors, (list, tuple)) and not isinstance(factors, Iterable):
         raise TypeError('factors must be an Iterable')
     if len(unit_names) != len(factors):
         raise ValueError('unit_names and factors must be of the same length')
     unit_names = validate_list_of_strings(unit_names, 'unit_names')
     index = None
 
+    # factors need not be sorted here, so scan them in the given order
     for index, val in enumerate(factors):
         if value < val:
             index -= 1
@@ -146,7 +220,59 @@ def format_quantity(value, unit_names, factors, decimals=2):
 
     index = max(0, index)  # handles sub msec
 
-    return '{} {}'.format(np.round(value / factors[index], decimals), unit_names[index])
+    return _format_at_scale(value, unit_names[index], factors[index], decimals)
+
+
+def _format_quantity_fast(value, unit_names, factors, decimals):
+    """
+    Formats the provided quantity without validating the inputs. Use format_quantity() unless the unit names and
+    factors are known to be valid and the factors are sorted in ascending order, as is the case for format_time()
+    and format_size()
+
+    Parameters
+    ----------
+    value : number
+        value in some base units. For example - time in seconds
+    unit_names : list or tuple
+        Names of units for each scale of the value
+    factors : list or tuple
+        Scaling factors for each scale of the value, sorted in ascending order
+    decimals : uint
+        Number of decimal places to which the value needs to be formatted
+
+    Returns
+    -------
+    str
+        String with value formatted correctly
+    """
+    # factors are sorted in ascending order. Pick the largest factor that does not exceed the value
+    index = max(0, bisect_right(factors, value) - 1)  # handles sub msec
+
+    return _format_at_scale(value, unit_names[index], factors[index], decimals)
+
+
+def _format_at_scale(value, unit_name, factor, decimals):
+    """
+    Formats the provided quantity at an already chosen scale. Shared by format_quantity() and
+    _format_quantity_fast(), which only differ in how they pick the scale
+
+    Parameters
+    ----------
+    value : number
+        value in some base units. For example - time in seconds
+    unit_name : str
+        Name of the unit of the chosen scale
+    factor : number
+        Scaling factor of the chosen scale
+    decimals : uint
+        Number of decimal places to which the value needs to be formatted
+
+    Returns
+    -------
+    str
+        String with value formatted correctly
+    """
+    return '%s %s' % (round(value / factor, decimals), unit_name)
 
 
 def format_time(time_in_seconds, decimals=2):
@@ -165,9 +291,18 @@ def format_time(time_in_seconds, decimals=2):
     str
         String with time formatted correctly
     """
-    units = ['msec', 'sec', 'mins', 'hours']
-    factors = [0.001, 1, 60, 3600]
-    return format_quantity(time_in_seconds, units, factors, decimals=decimals)
+    if type(time_in_seconds) in _CACHEABLE_TYPES and type(decimals) is int:
+        return _format_time_cached(time_in_seconds, decimals)
+    # Anything else such as numpy scalars or 0-dimensional arrays is formatted without the cache
+    return _format_quantity_fast(time_in_seconds, _TIME_UNITS, _TIME_FACTORS, decimals)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _format_time_cached(time_in_seconds, decimals):
+    """
+    Cached version of format_time() since the same durations tend to be formatted repeatedly
+    """
+    return _format_quantity_fast(time_in_seconds, _TIME_UNITS, _TIME_FACTORS, decimals)
 
 
 def format_size(size_in_bytes, decimals=2):
@@ -186,9 +321,18 @@ def format_size(size_in_bytes, decimals=2):
     str
         String with size formatted correctly
     """
-    units = ['bytes', 'kB', 'MB', 'GB', 'TB']
-    factors = 1024 ** np.arange(len(units), dtype=np.int64)
-    return format_quantity(size_in_bytes, units, factors, decimals=decimals)
+    if type(size_in_bytes) in _CACHEABLE_TYPES and type(decimals) is int:
+        return _format_size_cached(size_in_bytes, decimals)
+    # Anything else such as numpy scalars or 0-dimensional arrays is formatted without the cache
+    return _format_quantity_fast(size_in_bytes, _SIZE_UNITS, _SIZE_FACTORS, decimals)
+
+
+@lru_cache(maxsize=256, typed=True)
+def _format_size_cached(size_in_bytes, decimals):
+    """
+    Cached version of format_size() since the same sizes tend to be formatted repeatedly
+    """
+    return _format_quantity_fast(size_in_bytes, _SIZE_UNITS, _SIZE_FACTORS, decimals)
 
 
 def formatted_str_to_number(str_val, magnitude_names, magnitude_values, separator=' '):
@@ -218,7 +362,7 @@ def formatted_str_to_number(str_val, magnitude_names, magnitude_values, separato
         raise TypeError('separator must be a string')
     if not isinstance(magnitude_values, (list, tuple)):
         raise TypeError('magnitude_values must be an Iterable')
-    if not np.all([isinstance(_, Number) for _ in magnitude_values]):
+    if not all(isinstance(val, Number) for val in magnitude_values):
         raise TypeError('magnitude_values should contain numbers')
     if len(magnitude_names) != len(magnitude_values):
         raise ValueError('magnitude_names and magnitude_values should be of the same length')
@@ -232,6 +376,8 @@ def formatted_str_to_number(str_val, magnitude_names, magnitude_values, separato
             # Let it raise an exception. Don't catch
             return scaling * float(components[0])
 
+    raise ValueError('Unit: "{}" not found in magnitude_names: {}'.format(components[1], magnitude_names))
+
 
 def get_available_memory():
     """
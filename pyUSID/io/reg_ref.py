@@ -7,7 +7,10 @@ Created on Tue Nov  3 21:14:25 2015
 
 from __future__ import division, print_function, absolute_import, unicode_literals
 import sys
-from collections import Iterable
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 from warnings import warn
 import h5py
 import numpy as np
@@ -129,7 +132,7 @@ def attempt_reg_ref_build(h5_dset, dim_names, verbose=False):
     if len(h5_dset.shape) != 2:
         return dict()
 
-    if not np.all([isinstance(obj, (str, unicode)) for obj in dim_names]):
+    if not all(isinstance(obj, (str, unicode)) for obj in dim_names):
         raise TypeError('Unable to automatically generate region references for dataset: {} since one or more names'
                         ' of the region references was not a string'.format(h5_dset.name))
 
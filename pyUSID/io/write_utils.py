@@ -13,7 +13,10 @@ from warnings import warn
 from enum import Enum
 from itertools import groupby
 import numpy as np
-from collections import Iterable
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 from .dtype_utils import contains_integers, validate_list_of_strings, validate_single_string_arg
 
 __all__ = ['clean_string_att', 'get_aux_dset_slicing', 'make_indices_matrix', 'INDICES_DTYPE', 'VALUES_DTYPE', 'get_slope',
@@ -143,7 +146,7 @@ def validate_dimensions(dimensions, dim_type='Position'):
             warn(dim_type + ' dimensions should be specified by a 1D array-like. Raveled this numpy array for now')
     if not isinstance(dimensions, (list, np.ndarray, tuple)):
         raise TypeError(dim_type + ' dimensions should be array-like of Dimension objects')
-    if not np.all([isinstance(x, Dimension) for x in dimensions]):
+    if not all(isinstance(x, Dimension) for x in dimensions):
         raise TypeError(dim_type + ' dimensions should be a sequence of Dimension objects')
     return dimensions
 
@@ -492,7 +495,7 @@ def to_ranges(iterable):
 
     Parameters
     ----------
-    iterable : collections.Iterable object
+    iterable : collections.abc.Iterable object
         iterable object like a list
 
     Returns
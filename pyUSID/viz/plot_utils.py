@@ -350,7 +350,7 @@ def make_linear_alpha_cmap(name, solid_color, normalization_val, min_alpha=0, ma
         raise TypeError('solid_color must be a list of numbers')
     if not len(solid_color) == 4:
         raise ValueError('solid-color should have fourth values')
-    if not np.all([isinstance(x, Number) for x in solid_color]):
+    if not all(isinstance(x, Number) for x in solid_color):
         raise TypeError('solid_color should have three numbers for red, green, blue')
     if not isinstance(normalization_val, Number):
         raise TypeError('normalization_val must be a number')
@@ -520,7 +520,7 @@ def plot_line_family(axis, x_vec, line_family, line_names=None, label_prefix='',
     if line_names is not None:
         if not isinstance(line_names, (list, tuple)):
             raise TypeError('line_names should be a list of strings')
-        if not np.all([isinstance(x, (str, unicode)) for x in line_names]):
+        if not all(isinstance(x, (str, unicode)) for x in line_names):
             raise TypeError('line_names should be a list of strings')
         if len(line_names) != num_lines:
             raise ValueError('length of line_names not matching with that of line_family')
@@ -802,7 +802,7 @@ def plot_curves(excit_wfms, datasets, line_colors=[], dataset_names=[], evenly_s
             if not len(var.shape) == dim_size:
                 raise ValueError(mesg)
         elif isinstance(var, (list, tuple)):
-            if not np.all([isinstance(dset, (h5py.Dataset, np.ndarray)) for dset in datasets]):
+            if not all(isinstance(dset, (h5py.Dataset, np.ndarray)) for dset in datasets):
                 raise TypeError(mesg)
         else:
             raise TypeError(mesg)
@@ -865,7 +865,7 @@ def plot_curves(excit_wfms, datasets, line_colors=[], dataset_names=[], evenly_s
             mode = 1
 
         for var, var_name in zip([dataset_names, line_colors], ['dataset_names', 'line_colors']):
-            if not isinstance(var, (list, tuple)) or not np.all([isinstance(x, (str, unicode)) for x in var]):
+            if not isinstance(var, (list, tuple)) or not all(isinstance(x, (str, unicode)) for x in var):
                 raise TypeError(var_name + ' should be a list of strings')
             if len(var) > 0 and len(var) != len(datasets):
                 raise ValueError(var_name + ' is not of same length as datasets: ' + len(datasets))
@@ -1183,7 +1183,7 @@ def plot_map_stack(map_stack, num_comps=9, stdevs=2, color_bar_mode=None, evenly
     for var, var_name in zip([fig_mult, pad_mult], ['fig_mult', 'pad_mult']):
         if not isinstance(var, (list, tuple, np.ndarray)) or len(var) != 2:
             raise TypeError(var_name + ' should be a tuple / list / numpy array of size 2')
-        if not np.all([x > 0 and isinstance(x, Number) for x in var]):
+        if not all(isinstance(x, Number) and x > 0 for x in var):
             raise ValueError(var_name + ' should contain positive numbers')
 
     if reverse_dims:
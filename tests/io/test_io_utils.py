@@ -7,6 +7,11 @@ Created on Tue Nov  3 15:07:16 2017
 from __future__ import division, print_function, unicode_literals, absolute_import
 import unittest
 import sys
+import os
+import re
+import subprocess
+from time import strftime, localtime
+import numpy as np
 
 sys.path.append("../../pyUSID/")
 from pyUSID.io import io_utils
@@ -18,6 +23,10 @@ class TestFormattedStrToNum(unittest.TestCase):
     def test_typical(self):
         self.assertEqual(io_utils.formatted_str_to_number("4.32 MHz", ["MHz", "kHz"], [1E+6, 1E+3]), 4.32E+6)
 
+    def test_repeated_names(self):
+        self.assertEqual(io_utils.formatted_str_to_number("4.32 MHz", ["MHz", "kHz", "MHz"], [1E+6, 1E+3, 1E+9]),
+                         4.32E+6)
+
     def test_wrong_types(self):
         with self.assertRaises(TypeError):
             _ = io_utils.formatted_str_to_number({'dfdfd': 123}, ["MHz"], [1E+6])
@@ -41,6 +50,8 @@ class TestFormattedStrToNum(unittest.TestCase):
             _ = io_utils.formatted_str_to_number("1.2.3.4 MHz", ["MHz", "kHz"], [1E+6, 1E+3])
         with self.assertRaises(ValueError):
             _ = io_utils.formatted_str_to_number("MHz", ["MHz", "kHz"], [1E+6, 1E+3])
+        with self.assertRaises(ValueError):
+            _ = io_utils.formatted_str_to_number("4.32 GHz", ["MHz", "kHz"], [1E+6, 1E+3])
 
 
 class TestFormatQuantity(unittest.TestCase):
@@ -53,6 +64,10 @@ class TestFormatQuantity(unittest.TestCase):
         ret_val = io_utils.format_quantity(6300, qty_names, qty_factors)
         self.assertEqual(ret_val, '1.75 hours')
 
+    def test_unsorted_factors(self):
+        ret_val = io_utils.format_quantity(315, ['hours', 'mins', 'sec'], [3600, 60, 1])
+        self.assertEqual(ret_val, '0.09 hours')
+
     def test_illegal(self):
         with self.assertRaises(ValueError):
             _ = io_utils.format_quantity(315, ['sec', 'mins', 'hours'], [1, 60, 3600, 3600*24])
@@ -78,6 +93,115 @@ class TestTimeSizeFormatting(unittest.TestCase):
         ret_val = io_utils.format_size(5830418104.32)
         self.assertEqual(ret_val, '5.43 GB')
 
+    def test_repeated_calls(self):
+        for _ in range(3):
+            self.assertEqual(io_utils.format_size(15.23), '15.23 bytes')
+            self.assertEqual(io_utils.format_size(2048), '2.0 kB')
+            self.assertEqual(io_utils.format_size(2048, decimals=0), '2.0 kB')
+            self.assertEqual(io_utils.format_time(315), '5.25 mins')
+            self.assertEqual(io_utils.format_time(315.0, decimals=1), '5.2 mins')
+
+    @unittest.skipIf(sys.version_info.major < 3, 'lru_cache requires python 3')
+    def test_cache_used(self):
+        io_utils._format_size_cached.cache_clear()
+        io_utils._format_time_cached.cache_clear()
+        for _ in range(3):
+            self.assertEqual(io_utils.format_size(2048), '2.0 kB')
+            self.assertEqual(io_utils.format_time(315), '5.25 mins')
+        self.assertEqual(io_utils._format_size_cached.cache_info().hits, 2)
+        self.assertEqual(io_utils._format_time_cached.cache_info().hits, 2)
+
+    @unittest.skipIf(sys.version_info.major < 3, 'lru_cache requires python 3')
+    def test_non_builtin_bypasses_cache(self):
+        io_utils._format_size_cached.cache_clear()
+        io_utils._format_time_cached.cache_clear()
+        self.assertEqual(io_utils.format_size(np.array(5830418104.32)), '5.43 GB')
+        self.assertEqual(io_utils.format_time(np.array(315)), '5.25 mins')
+        self.assertEqual(io_utils.format_time(np.float64(315)), '5.25 mins')
+        self.assertEqual(io_utils._format_size_cached.cache_info().misses, 0)
+        self.assertEqual(io_utils._format_time_cached.cache_info().misses, 0)
+
+    @unittest.skipIf(sys.version_info.major < 3, 'unittest.mock requires python 3')
+    def test_invalid_value_computed_once(self):
+        from unittest import mock
+        with mock.patch.object(io_utils, '_format_quantity_fast',
+                               wraps=io_utils._format_quantity_fast) as mock_fast:
+            with self.assertRaises(TypeError):
+                _ = io_utils.format_size('abc')
+        self.assertEqual(mock_fast.call_count, 1)
+
+
+class TestGetTimeStamp(unittest.TestCase):
+
+    def test_format(self):
+        ret_val = io_utils.get_time_stamp()
+        self.assertIsInstance(ret_val, str)
+        self.assertIsNotNone(re.match(r'^\d{4}_\d{2}_\d{2}-\d{2}_\d{2}_\d{2}$', ret_val))
+
+    def test_matches_strftime(self):
+        before = strftime('%Y_%m_%d-%H_%M_%S')
+        ret_val = io_utils.get_time_stamp()
+        after = strftime('%Y_%m_%d-%H_%M_%S')
+        self.assertIn(ret_val, [before, after])
+
+    @unittest.skipIf(sys.version_info.major < 3, 'unittest.mock requires python 3')
+    def test_cached_within_second(self):
+        from unittest import mock
+        io_utils._ts_cache.__dict__.clear()
+        with mock.patch.object(io_utils, 'time', side_effect=[1000000.2, 1000000.7]):
+            with mock.patch.object(io_utils, 'strftime', wraps=strftime) as mock_strftime:
+                first = io_utils.get_time_stamp()
+                second = io_utils.get_time_stamp()
+        self.assertEqual(first, second)
+        self.assertEqual(mock_strftime.call_count, 1)
+
+    @unittest.skipIf(sys.version_info.major < 3, 'unittest.mock requires python 3')
+    def test_new_second(self):
+        from unittest import mock
+        io_utils._ts_cache.__dict__.clear()
+        with mock.patch.object(io_utils, 'time', side_effect=[1000000.7, 1000001.2]):
+            first = io_utils.get_time_stamp()
+            second = io_utils.get_time_stamp()
+        self.assertNotEqual(first, second)
+        self.assertEqual(second, strftime('%Y_%m_%d-%H_%M_%S', localtime(1000001)))
+
+    @unittest.skipIf(sys.version_info.major < 3, 'unittest.mock requires python 3')
+    def test_cache_disabled(self):
+        from unittest import mock
+        with mock.patch.object(io_utils, '_TS_CACHE_ENABLED', False):
+            with mock.patch.object(io_utils, 'strftime', wraps=strftime) as mock_strftime:
+                _ = io_utils.get_time_stamp()
+                _ = io_utils.get_time_stamp()
+        self.assertEqual(mock_strftime.call_count, 2)
+
+    def test_env_var_disables_cache(self):
+        code = 'from pyUSID.io import io_utils; print(io_utils._TS_CACHE_ENABLED)'
+        pkg_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(io_utils.__file__))))
+        env = dict(os.environ, PYUSID_TS_CACHE='0',
+                   PYTHONPATH=os.pathsep.join([pkg_root, os.environ.get('PYTHONPATH', '')]))
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        self.assertEqual(out.decode().strip().splitlines()[-1], 'False')
+
+
+class TestFileDialog(unittest.TestCase):
+
+    @unittest.skipIf(sys.version_info.major < 3, 'unittest.mock requires python 3')
+    def test_text_input_over_ssh(self):
+        from unittest import mock
+        with mock.patch.object(io_utils, 'check_ssh', return_value=True):
+            with mock.patch('builtins.input', return_value='/tmp/data file.h5') as mock_input:
+                ret_val = io_utils.file_dialog()
+        self.assertEqual(ret_val, '/tmp/data file.h5')
+        self.assertEqual(mock_input.call_count, 1)
+
+    @unittest.skipIf(sys.version_info.major < 3, 'unittest.mock requires python 3')
+    def test_text_input_eof(self):
+        from unittest import mock
+        with mock.patch.object(io_utils, 'check_ssh', return_value=True):
+            with mock.patch('builtins.input', side_effect=EOFError):
+                with self.assertRaises(EOFError):
+                    _ = io_utils.file_dialog()
+
 
 class TestIOUtils(unittest.TestCase):
 